@@ -9,6 +9,7 @@
 
 import datetime
 import os
+import re
 import sys
 
 # Load all of the global Astropy configuration
@@ -19,11 +20,27 @@ except ImportError:
           'to be installed')
     sys.exit(1)
 
-# Get configuration information from setup.cfg
-from configparser import ConfigParser
-conf = ConfigParser()
-conf.read([os.path.join(os.path.dirname(__file__), '..', 'setup.cfg')])
-setup_cfg = dict(conf.items('metadata'))
+# Get configuration information from setup.cfg. Only simple single-line
+# "key = value" entries in the [metadata] section are read; interpolation,
+# continuation lines, and inline comments are not supported.
+_section_re = re.compile(r'^\[([^\]]+)\]')
+_kv_re = re.compile(r'^([^=\s]+)\s*=\s*(.*)$')
+setup_cfg = {}
+with open(os.path.join(os.path.dirname(__file__), '..', 'setup.cfg'), 'r',
+          encoding='utf-8') as _fin:
+    _section = None
+    for _line in _fin:
+        _m = _section_re.match(_line)
+        if _m is not None:
+            _section = _m.group(1)
+            continue
+        if _section != 'metadata':
+            continue
+        _m = _kv_re.match(_line)
+        if _m is not None:
+            setup_cfg[_m.group(1)] = _m.group(2).strip()
+            if 'name' in setup_cfg and 'author' in setup_cfg:
+                break
 
 # -- General configuration ---------------------------------------------------
 
@@ -37,6 +54,13 @@ setup_cfg = dict(conf.items('metadata'))
 # List of patterns, relative to source directory, that match files and
 # directories to ignore when looking for source files.
 exclude_patterns.append('_templates')  # noqa
+exclude_patterns.append('**/.ipynb_checkpoints')  # noqa
+
+# The doctree cache can be shared across builds by setting SPHINX_DOCTREEDIR,
+# which the Makefile passes to "sphinx-build -d". For the cache to be reused,
+# configuration values must not change between builds; in particular,
+# today_fmt and html_last_updated_fmt are intentionally left unset because
+# they embed build timestamps.
 
 # This is added to the end of RST files - a good place to put substitutions to
 # be used globally.
@@ -50,8 +74,11 @@ project = setup_cfg['name']
 author = setup_cfg['author']
 copyright = f'{datetime.datetime.now().year}, {author}'
 
-# The full version, including alpha/beta/rc tags.
-release = "0.1.dev"
+# The full version, including alpha/beta/rc tags. This is hard-coded rather
+# than read from the installed package so that per-commit dev versions
+# (e.g., 0.1.dev123+gabcdef) do not invalidate the Sphinx environment cache.
+# It can be pinned with SPHINX_RELEASE_OVERRIDE for reproducible builds.
+release = os.environ.get('SPHINX_RELEASE_OVERRIDE', '0.1.dev')
 # The short X.Y version.
 version = '.'.join(release.split('.')[:2])
 
@@ -138,7 +165,9 @@ linkcheck_ignore = [
 linkcheck_timeout = 180
 linkcheck_anchors = True
 
+# Add any paths that contain custom static files (such as style sheets) here,
+# relative to this directory.
+html_static_path = ['_static']
 
 # This loads custom CSS to fix table column not wrapping
-def setup(app):
-    app.add_css_file('theme_overrides.css')
+html_css_files = ['theme_overrides.css']
@@ -6,7 +6,10 @@ if "%SPHINXBUILD%" == "" (
 	set SPHINXBUILD=sphinx-build
 )
 set BUILDDIR=_build
-set ALLSPHINXOPTS=-d %BUILDDIR%/doctrees %SPHINXOPTS% .
+if "%SPHINX_DOCTREEDIR%" == "" (
+	set SPHINX_DOCTREEDIR=%BUILDDIR%/doctrees
+)
+set ALLSPHINXOPTS=-d %SPHINX_DOCTREEDIR% %SPHINXOPTS% .
 if NOT "%PAPER%" == "" (
 	set ALLSPHINXOPTS=-D latex_paper_size=%PAPER% %ALLSPHINXOPTS%
 )
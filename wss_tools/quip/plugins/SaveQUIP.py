@@ -21,6 +21,8 @@ the given "QUIP Operation File". In addition to output images, "QUIP Out" and
 # STDLIB
 import os
 import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor, wait
 
 # GINGA
 from ginga.gw import Widgets
@@ -47,9 +49,14 @@ class SaveQUIP(SaveImageParent):
         self.logfile = QUIP_DIRECTIVE['OUTPUT']['LOG_FILE_PATH']
         self.stafile = QUIP_DIRECTIVE['OUTPUT']['OUT_FILE_PATH']
 
+        # (channel name, change history entries) of last QUIP log written
+        self._last_quiplog_key = None
+
+        # Output image list in last written QUIP Out
+        self._last_sta_images = None
+
         # Ensure output directory exists
-        if not os.path.exists(self.outdir):
-            os.makedirs(self.outdir)
+        os.makedirs(self.outdir, exist_ok=True)
 
     def build_gui(self, container):
         """Build GUI such that image list area is maximized."""
@@ -160,17 +167,32 @@ class SaveQUIP(SaveImageParent):
 
         file_dict = history_obj.name_dict[channel.name]
 
+        # Nothing to do if change history has not changed since last write.
+        # Timestamps only have 1-second resolution and entries can also be
+        # removed, so all (image name, timestamp) pairs are compared.
+        quiplog_key = (channel.name,
+                       frozenset((imname, timestamp)
+                                 for imname, entries in file_dict.items()
+                                 for timestamp in entries))
+        if quiplog_key == self._last_quiplog_key:
+            self.logger.info(f'No new changes, skipping {self.logfile}')
+            return
+
+        self.logger.info(f'Saving {self.logfile}')
+
         # Insert change history into QUIP log, ordered by image name,
         # and then by timestamp.
-        for imname in sorted(file_dict):
-            entries = file_dict[imname]
-            for timestamp in sorted(entries):
-                bnch = entries[timestamp]
-                date_str, time_str = timestamp.split(' ')
-                QUIP_LOG.add_entry(date_str, time_str, imname, imname,
-                                   bnch.DESCRIP, 'status')
-
-        output_xml(QUIP_LOG.xml_dict(), self.logfile)
+        items = sorted(((imname, timestamp, bnch)
+                        for imname, entries in file_dict.items()
+                        for timestamp, bnch in entries.items()),
+                       key=lambda x: x[:2])
+        for imname, timestamp, bnch in items:
+            date_str, time_str = timestamp.split(' ')
+            QUIP_LOG.add_entry(date_str, time_str, imname, imname,
+                               bnch.DESCRIP, 'status')
+
+        output_xml(QUIP_LOG.iter_xml(), self.logfile)
+        self._last_quiplog_key = quiplog_key
 
     def save_images(self):
         """Save selected images and output XML files.
@@ -192,36 +214,73 @@ class SaveQUIP(SaveImageParent):
         if self.settings.get('include_chname', True):
             sfx += '_' + self.chname
 
+        # List output directory once instead of checking each file.
+        # Names are compared with normcase for case-insensitive Windows paths.
+        with os.scandir(self.outdir) as it:
+            existing = {os.path.normcase(entry.name) for entry in it}
+
         # Process each selected file. Each can have multiple edited extensions.
+        to_write = []
         for infile in res_dict:
             f_pfx = os.path.splitext(infile)[0]  # prefix
             f_ext = '.fits'  # Only FITS supported
             oname = f_pfx + sfx + f_ext
             outfile = os.path.join(self.outdir, oname)
 
-            self.w.status.set_text(
-                f'Writing out {shorten_name(infile, 10)} to '
-                f'{shorten_name(oname, 10)} ...')
-            self.logger.debug(
-                f'Writing out {infile} to {oname} ...')
-
-            if os.path.exists(outfile) and not clobber:
+            if os.path.normcase(oname) in existing and not clobber:
                 self.logger.error(f'{outfile} already exists')
                 continue
 
-            bnch = res_dict[infile]
-
-            if bnch.path is None or not os.path.isfile(bnch.path):
-                self._write_mosaic(f_pfx, outfile)
-            else:
-                shutil.copyfile(bnch.path, outfile)
-                self._write_mef(f_pfx, bnch.extlist, outfile)
-
-            output_images.append(outfile)
-            self.logger.info(f'{outfile} written')
+            # Different images (e.g., extensions of the same file) can map to
+            # the same output name; only the first one is written.
+            existing.add(os.path.normcase(oname))
+            to_write.append((infile, oname, f_pfx, outfile, res_dict[infile]))
+
+        # Copying original files is pure I/O, so it is done in parallel.
+        # Writing edited data uses Ginga, so that stays on the GUI thread.
+        with ThreadPoolExecutor(
+                max_workers=max(1, min(8, len(to_write)))) as executor:
+            copies = {}
+            try:
+                for infile, oname, f_pfx, outfile, bnch in to_write:
+                    is_file = False
+                    if bnch.path is not None:
+                        try:
+                            is_file = stat.S_ISREG(os.stat(bnch.path).st_mode)
+                        except (OSError, ValueError):
+                            pass
+                    if is_file:
+                        copies[outfile] = executor.submit(
+                            shutil.copyfile, bnch.path, outfile)
+
+                for infile, oname, f_pfx, outfile, bnch in to_write:
+                    self.w.status.set_text(
+                        f'Writing out {shorten_name(infile, 10)} to '
+                        f'{shorten_name(oname, 10)} ...')
+                    self.logger.debug(
+                        f'Writing out {infile} to {oname} ...')
+
+                    if outfile in copies:
+                        copies[outfile].result()
+                        self._write_mef(f_pfx, bnch.extlist, outfile)
+                    else:
+                        self._write_mosaic(f_pfx, outfile)
+
+                    output_images.append(outfile)
+                    self.logger.info(f'{outfile} written')
+            except Exception:
+                # Do not leave unedited copies behind under QUIP output names.
+                for future in copies.values():
+                    future.cancel()
+                wait(copies.values())
+                for outfile, future in copies.items():
+                    if (not future.cancelled() and
+                            outfile not in output_images and
+                            os.path.exists(outfile)):
+                        os.remove(outfile)
+                raise
 
         # Save QUIP Log, which stores change history
-        self.logger.info(f'Saving {self.logfile}')
         try:
             self._write_quiplog()
         except Exception as e:
@@ -229,10 +288,14 @@ class SaveQUIP(SaveImageParent):
             self.logger.error(str(e))
             return
 
-        # Save QUIP Out, which stores output image list
-        self.logger.info(f'Saving {self.stafile}')
+        # Save QUIP Out, which stores output image list. Its timestamp changes
+        # on every call, so only the image list is used to detect changes.
+        sta_images = tuple(output_images)
         try:
-            output_xml(quip_out_dict(images=output_images), self.stafile)
+            if sta_images != self._last_sta_images:
+                self.logger.info(f'Saving {self.stafile}')
+                output_xml(quip_out_dict(images=output_images), self.stafile)
+                self._last_sta_images = sta_images
         except Exception as e:
             self.w.status.set_text('Cannot write QUIP out!')
             self.logger.error(str(e))
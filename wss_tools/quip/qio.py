@@ -4,6 +4,7 @@
 import os
 import warnings
 import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape
 
 # THIRD-PARTY
 from astropy.utils.data import get_pkg_data_filename
@@ -282,6 +283,60 @@ class QUIPLog:
 
         return {'QUIP_ACTIVITY_LOG': d}
 
+    def iter_xml(self):
+        """Generate QUIP Output Log XML one line at a time.
+
+        This produces the same layout as passing :meth:`xml_dict` to
+        :func:`~wss_tools.utils.io.output_xml` but without going through
+        intermediate dictionary and DOM objects.
+
+        Yields
+        ------
+        line : str
+            A line of XML, including the newline character.
+
+        """
+        indent = '    '
+
+        # Whitespace in attribute values must be escaped to survive
+        # attribute-value normalization when parsed.
+        attr_entities = {'"': '&quot;', '\n': '&#10;', '\r': '&#13;',
+                         '\t': '&#9;'}
+
+        def _attrs(d):
+            return ''.join(f' {k[1:]}="{escape(str(v), attr_entities)}"'
+                           for k, v in d.items())
+
+        def _elem(tag, val, level):
+            pad = indent * level
+            val = escape(str(val))
+            if val:
+                return f'{pad}<{tag}>{val}</{tag}>\n'
+            return f'{pad}<{tag}/>\n'
+
+        root = 'QUIP_ACTIVITY_LOG'
+        root_attrs = _attrs({**self.creation_time, **self.quip_info})
+
+        yield '<?xml version="1.0" ?>\n'
+
+        if not self.log_entries:
+            yield f'<{root}{root_attrs}/>\n'
+            return
+
+        yield f'<{root}{root_attrs}>\n'
+
+        for i, en in enumerate(self.log_entries, 1):
+            en_attrs = {'@id': i}
+            en_attrs.update((k, v) for k, v in en.xml_dict.items()
+                            if k.startswith('@'))
+            yield f'{indent}<LOG_ENTRY{_attrs(en_attrs)}>\n'
+            yield _elem('ENTRY_DESCRIPTION', en.xml_dict['ENTRY_DESCRIPTION'],
+                        2)
+            yield _elem('ENTRY_DATA', en.xml_dict['ENTRY_DATA'], 2)
+            yield f'{indent}</LOG_ENTRY>\n'
+
+        yield f'</{root}>\n'
+
 
 class QUIPLogEntry:
     """Class to handle each log entry for `QUIPLog`.
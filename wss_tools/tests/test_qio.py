@@ -1,9 +1,11 @@
 import glob
 import os
+import xml.etree.ElementTree as ET
 
 from astropy.utils.data import get_pkg_data_filename
 
 from wss_tools.quip import qio
+from wss_tools.utils.io import _etree_to_dict, output_xml
 
 
 def test_opfile_validation():
@@ -61,3 +63,58 @@ def test_get_quip_info():
     assert quip_info['@creator'] == 'QUIP'
     assert quip_info['@operational'] == 'false'
     assert isinstance(quip_info['@version'], str)
+
+
+def test_quiplog_iter_xml():
+    """Test streamed QUIP Log XML."""
+    log = qio.QUIPLog()
+    log.creation_time = {'@date': '2017-06-14Z', '@time': '09:00:00.000000Z'}
+    log.quip_info = {'@creator': 'QUIP', '@version': '1.0',
+                     '@operational': 'false'}
+    root_attrs = ('date="2017-06-14Z" time="09:00:00.000000Z" '
+                  'creator="QUIP" version="1.0" operational="false"')
+
+    assert ''.join(log.iter_xml()) == (
+        '<?xml version="1.0" ?>\n'
+        f'<QUIP_ACTIVITY_LOG {root_attrs}/>\n')
+
+    log.add_entry('2017-06-14', '10:00:00', 'a.fits', 'a.fits',
+                  'desc "quoted" & <tagged>', 'status')
+    log.add_entry('2017-06-14', '10:00:01', 'b.fits', 'b.fits', '',
+                  'warning')
+
+    assert ''.join(log.iter_xml()) == (
+        '<?xml version="1.0" ?>\n'
+        f'<QUIP_ACTIVITY_LOG {root_attrs}>\n'
+        '    <LOG_ENTRY id="1" type="status" date="2017-06-14" '
+        'time="10:00:00">\n'
+        '        <ENTRY_DESCRIPTION>a.fits</ENTRY_DESCRIPTION>\n'
+        '        <ENTRY_DATA>desc "quoted" &amp; &lt;tagged&gt;</ENTRY_DATA>\n'
+        '    </LOG_ENTRY>\n'
+        '    <LOG_ENTRY id="2" type="warning" date="2017-06-14" '
+        'time="10:00:01">\n'
+        '        <ENTRY_DESCRIPTION>b.fits</ENTRY_DESCRIPTION>\n'
+        '        <ENTRY_DATA/>\n'
+        '    </LOG_ENTRY>\n'
+        '</QUIP_ACTIVITY_LOG>\n')
+
+
+def test_quiplog_iter_xml_roundtrip(tmpdir):
+    """Streamed QUIP Log must be valid and match the dictionary output."""
+    log = qio.QUIPLog()
+    log.add_entry('2020-11-18Z', '19:03:29Z', 'image[SCI,1]', 'image[SCI,1]',
+                  '10.0 subtracted from image[SCI,1] (x=100, y=200)',
+                  'status')
+    log.add_entry('2020-11-18Z', '19:03:30Z', 'image[SCI,2]', 'image[SCI,2]',
+                  'a "quoted" & <tagged> value', 'warning')
+
+    streamed = str(tmpdir.join('streamed.xml'))
+    from_dict = str(tmpdir.join('from_dict.xml'))
+    output_xml(log.iter_xml(), streamed)
+    output_xml(log.xml_dict(), from_dict)
+
+    returncode, _, _ = qio.validate_output_log_xml(streamed)
+    assert returncode == 0
+
+    assert (_etree_to_dict(ET.parse(streamed).getroot()) ==
+            _etree_to_dict(ET.parse(from_dict).getroot()))
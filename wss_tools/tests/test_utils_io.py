@@ -1,3 +1,5 @@
+import pytest
+
 from wss_tools.utils.io import output_xml
 
 
@@ -12,3 +14,22 @@ def test_output_xml(tmpdir):
     assert len(lines) == 2
     assert lines[0] == '<?xml version="1.0" ?>\n'
     assert lines[1] == '<foo>bar</foo>\n'
+
+
+@pytest.mark.parametrize('as_lines', [False, True])
+def test_output_xml_serialized(tmpdir, as_lines):
+    filename = str(tmpdir.join('simple.xml'))
+    lines = ['<?xml version="1.0" ?>\n',
+             '<foo id="1">\n',
+             '    <bar>a</bar>\n',
+             '</foo>\n']
+    if as_lines:
+        output_xml(iter(lines), filename)
+    else:
+        output_xml(''.join(lines), filename)
+
+    with open(filename) as f:
+        assert f.readlines() == lines
+
+    with pytest.raises(OSError, match='exists'):
+        output_xml(''.join(lines), filename)
@@ -63,13 +63,26 @@ def _dict_to_etree(parent, dictitem):
 
 
 # https://stackoverflow.com/questions/17402323/use-xml-etree-elementtree-to-write-out-nicely-formatted-xml-files
+def _dict_to_xml_str(xmldict):
+    """Serialize given dictionary to pretty-printed XML string."""
+    roottag = list(xmldict)[0]
+    root = ET.Element(roottag)
+    _dict_to_etree(root, xmldict[roottag])
+
+    rough_string = ET.tostring(root, 'utf-8')
+    reparsed = minidom.parseString(rough_string)
+    return reparsed.toprettyxml(indent='    ')
+
+
 def output_xml(xmldict, filename):
     """Write given dictionary to XML.
 
     Parameters
     ----------
-    xmldict : dict
-        Dictionary to be converted.
+    xmldict : dict, str, or iterable of str
+        Dictionary to be converted. XML that is already serialized
+        can also be given, either as a string or as an iterable of
+        strings (e.g., lines); it is written as-is.
 
     filename : str
         Output XML file.
@@ -80,18 +93,18 @@ def output_xml(xmldict, filename):
         Output file exists.
 
     """
-    roottag = list(xmldict)[0]
-    root = ET.Element(roottag)
-    _dict_to_etree(root, xmldict[roottag])
-
-    rough_string = ET.tostring(root, 'utf-8')
-    reparsed = minidom.parseString(rough_string)
+    # Serialize fully before opening the file, so that a failure
+    # does not leave a partial file behind.
+    if isinstance(xmldict, dict):
+        xmldict = _dict_to_xml_str(xmldict)
+    elif not isinstance(xmldict, str):
+        xmldict = ''.join(xmldict)
 
     if os.path.exists(filename):
         raise OSError(f'{filename} exists')
 
     with open(filename, 'w') as fout:
-        fout.write(reparsed.toprettyxml(indent='    '))
+        fout.write(xmldict)
 
 
 # -------------- #